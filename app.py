@@ -1,10 +1,12 @@
 # app_brieflyai.py
+import hashlib
 import io
 import os
-import re
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime, date
+from datetime import date
 import typing as t
 
 import pandas as pd
@@ -20,6 +22,9 @@ from google.auth.transport.requests import Request  # for token refresh
 # --- LLM (Ollama local model) ---
 from langchain_ollama import OllamaLLM
 
+# --- Hot-path text parsing (mypyc-compilable module) ---
+from parsing import extract_json, only_future_iso_or_none, parse_vtt
+
 # ===================================================
 # App setup
 # ===================================================
@@ -28,26 +33,27 @@ st.set_page_config(page_title="brieflyAI — Meeting Actions, Fast", layout="wid
 # --- THEME TOGGLE ---
 theme = st.radio("Theme", ["Light", "Dark"], horizontal=True, index=0)
 
-def inject_theme_css(mode: str):
+# Base colors live in .streamlit/config.toml; only the rules config can't
+# express stay here, built once per mode instead of per rerun.
+@st.cache_data(show_spinner=False)
+def _theme_css(mode: str) -> str:
     if mode == "Dark":
-        st.markdown("""
+        return """
         <style>
           body, .main, .block-container { background:#0c0c0c; color:#f2f2f2; }
           h1,h2,h3,h4,h5,h6, .stMarkdown p { color:#ffffff !important; }
           .stDataFrame { filter: brightness(0.98); }
           hr { border-color:#2b2b2b !important; }
         </style>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
-        <style>
-          body, .main, .block-container { background:#ffffff; color:#1c1c1c; }
-          h1,h2,h3,h4,h5,h6, .stMarkdown p { color:#111111 !important; }
-          hr { border-color:#ececec !important; }
-        </style>
-        """, unsafe_allow_html=True)
+        """
+    return """
+    <style>
+      h1,h2,h3,h4,h5,h6, .stMarkdown p { color:#111111 !important; }
+      hr { border-color:#ececec !important; }
+    </style>
+    """
 
-inject_theme_css(theme)
+st.markdown(_theme_css(theme), unsafe_allow_html=True)
 
 # --- BANNER (auto picks dark/light) ---
 banner_light = Path("light_brieflyai.png")
@@ -74,83 +80,61 @@ RESULT_COLS = ["File", "Summary", "Action", "Owner", "Due"]
 # Utilities
 # ===================================================
 
-# Date + VTT helpers
-ISO_DATE_RE   = re.compile(r"\b(20\d{2})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])\b")
-VTT_TS_LINE   = re.compile(r"^\d{2}:\d{2}:\d{2}\.\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}\.\d{3}")
-VTT_INLINE_TS = re.compile(r"\b\d{1,2}:\d{2}(:\d{2})?(?:\.\d{1,3})?\b")  # 0:12, 01:02:03
-
-def only_future_iso_or_none(s: str | None) -> str:
-    """Return YYYY-MM-DD if present AND >= today; else 'None'."""
-    if not s:
-        return "None"
-    m = ISO_DATE_RE.search(s)
-    if not m:
-        return "None"
-    try:
-        d = datetime.strptime(m.group(0), "%Y-%m-%d").date()
-        return d.isoformat() if d >= date.today() else "None"
-    except Exception:
-        return "None"
-
-def parse_vtt(vtt_text: str) -> str:
-    """Remove cue lines and inline timestamps; keep spoken content."""
-    kept = []
-    for line in vtt_text.splitlines():
-        if VTT_TS_LINE.match(line):
-            continue
-        line = VTT_INLINE_TS.sub(" ", line)
-        line = line.strip()
-        if not line:
-            continue
-        if line.isdigit():  # cue index
-            continue
-        if line.lower().startswith(("webvtt", "kind:", "language:")):
-            continue
-        kept.append(line)
-    return re.sub(r"\s{2,}", " ", " ".join(kept)).strip()
-
-def read_uploaded_text(file) -> str:
-    content = file.read()
+@st.cache_data(max_entries=32, show_spinner=False)
+def _parse_cached(name: str, content: bytes) -> str:
     try:
         txt = content.decode("utf-8", errors="ignore")
     except Exception:
         txt = str(content)
-    if file.name.lower().endswith(".vtt"):
+    if name.lower().endswith(".vtt"):
         return parse_vtt(txt)
     return txt
 
-def extract_json(text: str) -> t.Optional[dict]:
-    """Robustly extract the last valid JSON object/array from an LLM response."""
-    # ```json ... ```
-    m = re.search(r"```json\s*(\{.*?\}|\[.*?\])\s*```", text, re.S)
-    if m:
-        try:
-            return json.loads(m.group(1))
-        except Exception:
-            pass
-    # any {...} or [...]
-    candidates = re.findall(r"(\{.*\}|\[.*\])", text, re.S)
-    for cand in reversed(candidates):
-        try:
-            return json.loads(cand)
-        except Exception:
-            continue
-    # full string
-    try:
-        return json.loads(text)
-    except Exception:
-        return None
+def read_uploaded_text(file) -> str:
+    # file_uploader keeps the bytes across reruns; keying the cache on
+    # (name, content) means an unchanged upload skips VTT cleanup entirely.
+    return _parse_cached(file.name, file.getvalue())
 
 # ===================================================
 # LLM setup & prompt
 # ===================================================
+LLM_MODEL = "llama3"
+PROMPT_VERSION = "1"  # bump to invalidate cached LLM responses after prompt edits
+
 @st.cache_resource
 def get_llm():
-    # temperature 0 for structured consistency
-    return OllamaLLM(model="llama3", temperature=0)
+    # temperature 0 for structured consistency. keep_alive pins the model
+    # in memory between calls (no tens-of-seconds cold reload mid-session);
+    # num_ctx comfortably fits the truncated prompt so Ollama never silently
+    # drops transcript tokens, and num_predict bounds the JSON response.
+    return OllamaLLM(
+        model=LLM_MODEL,
+        temperature=0,
+        keep_alive="30m",
+        num_ctx=8192,
+        num_predict=512,
+    )
 
 LLM = get_llm()
 
+def _prompt_key(prompt: str) -> str:
+    """Small, stable cache key covering model + prompt version + full prompt."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{LLM_MODEL}:{PROMPT_VERSION}:".encode())
+    h.update(prompt.encode())
+    return h.hexdigest()
+
+# Cap in-flight Ollama calls; more workers than this just queue server-side.
+_LLM_SEMAPHORE = threading.Semaphore(2)
+
+@st.cache_data(show_spinner=False, persist="disk")
+def _cached_invoke(prompt_key: str, _prompt: str) -> str:
+    # prompt_key is the only hashed arg (leading underscore skips _prompt),
+    # so identical transcripts short-circuit to a disk lookup instead of a
+    # multi-second Ollama call.
+    with _LLM_SEMAPHORE:
+        return LLM.invoke(_prompt)
+
 OUTPUT_SCHEMA = """
 Return ONLY valid JSON (no backticks, no prose), exactly:
 
@@ -162,36 +146,86 @@ Return ONLY valid JSON (no backticks, no prose), exactly:
 }
 """
 
+MAX_PROMPT_CHARS = 12_000  # ~3k tokens; bounds Ollama latency per call
+
+def _truncate_transcript(transcript: str) -> str:
+    """Keep head + tail of over-long transcripts within MAX_PROMPT_CHARS.
+
+    Openings carry agenda/attendees and endings carry the decisions and
+    action-item recaps, so head+tail preserves most extractable content
+    while keeping prompt cost constant regardless of meeting length.
+    """
+    if len(transcript) <= MAX_PROMPT_CHARS:
+        return transcript
+    head = (MAX_PROMPT_CHARS * 2) // 3
+    tail = MAX_PROMPT_CHARS - head
+    return f"{transcript[:head]}\n[... transcript truncated ...]\n{transcript[-tail:]}"
+
+# Static instruction block built once at import; a stable prompt prefix also
+# lets Ollama reuse its KV cache across calls.
+_PROMPT_HEADER = (
+    "You are a meticulous meeting parser.\n\n"
+    "RULES:\n"
+    "1) The input may come from a WebVTT file. IGNORE all timestamp lines (e.g., '00:00:01.000 --> 00:00:04.000') "
+    "   and any inline time tokens like '0:12' or '01:02:03' — these are NOT dates.\n"
+    "2) Extract only concrete decisions and action items. No chit-chat.\n"
+    "3) If an owner/due date is not explicitly clear, set it to 'None'. Do NOT guess.\n"
+    "4) Dates MUST be ISO (YYYY-MM-DD). If you see natural language dates, convert them; otherwise 'None'.\n"
+    "5) Output STRICT JSON per the schema below. No explanations.\n\n"
+    f"{OUTPUT_SCHEMA}\n\n"
+    "Transcript (timestamps already removed where possible):\n"
+)
+
 def build_prompt(transcript: str) -> str:
-    return (
-        "You are a meticulous meeting parser.\n\n"
-        "RULES:\n"
-        "1) The input may come from a WebVTT file. IGNORE all timestamp lines (e.g., '00:00:01.000 --> 00:00:04.000') "
-        "   and any inline time tokens like '0:12' or '01:02:03' — these are NOT dates.\n"
-        "2) Extract only concrete decisions and action items. No chit-chat.\n"
-        "3) If an owner/due date is not explicitly clear, set it to 'None'. Do NOT guess.\n"
-        "4) Dates MUST be ISO (YYYY-MM-DD). If you see natural language dates, convert them; otherwise 'None'.\n"
-        "5) Output STRICT JSON per the schema below. No explanations.\n\n"
-        f"{OUTPUT_SCHEMA}\n\n"
-        f"Transcript (timestamps already removed where possible):\n{transcript}\n"
-    )
+    return "".join((_PROMPT_HEADER, _truncate_transcript(transcript), "\n"))
 
-def analyze_transcript(transcript: str) -> dict:
+def analyze_transcript(transcript: str, stream: bool = False) -> dict:
+    """Run the LLM over one transcript. With stream=True the response is
+    rendered token-by-token into a placeholder (interactive mode); batch
+    callers (e.g. Drive import) leave it off and stay silent."""
     prompt = build_prompt(transcript)
-    raw = LLM.invoke(prompt)
+    if stream:
+        placeholder = st.empty()
+        chunks: list[str] = []
+        for chunk in LLM.stream(prompt):
+            chunks.append(chunk)
+            placeholder.markdown("".join(chunks))
+        placeholder.empty()
+        raw = "".join(chunks)
+    else:
+        raw = _cached_invoke(_prompt_key(prompt), prompt)
     data = extract_json(raw)
     if not data:
         data = {"summary": raw[:1000], "items": []}
     # normalize items
     clean_items = []
+    today = date.today()  # one clock read for the whole item loop
     for it in data.get("items", []):
         action = (it.get("action") or "").strip()
         owner  = (it.get("owner")  or "None").strip() or "None"
-        due    = only_future_iso_or_none(it.get("due"))
+        due    = only_future_iso_or_none(it.get("due"), today=today)
         clean_items.append({"action": action or "None", "owner": owner, "due": due})
     data["items"] = clean_items
     return data
 
+MAX_ANALYSIS_WORKERS = 4
+
+def _rows_for(name: str, data: dict) -> list[dict]:
+    """Flatten one analysis result into RESULT_COLS row dicts."""
+    summary = data.get("summary", "")
+    items = data.get("items") or [{"action": "", "owner": "None", "due": "None"}]
+    return [{
+        "File": name,
+        "Summary": summary,
+        "Action": it.get("action", ""),
+        "Owner": it.get("owner", "None"),
+        "Due": it.get("due", "None"),
+    } for it in items]
+
+def _process_one(name: str, text: str) -> list[dict]:
+    """Per-file unit of work for the thread pool (no widget calls in here)."""
+    return _rows_for(name, analyze_transcript(text))
+
 # ===================================================
 # Google OAuth helpers (Drive & Tasks)
 # ===================================================
@@ -224,40 +258,106 @@ def ensure_creds(token_path: str, scopes: list[str]) -> t.Optional[Credentials]:
                 return None
     return creds
 
+@st.cache_resource
+def _drive_client(token_json: str):
+    """One Drive client per credential set; discovery build costs ~100s of ms."""
+    creds = Credentials.from_authorized_user_info(json.loads(token_json))
+    return build("drive", "v3", credentials=creds)
+
+@st.cache_resource
+def _tasks_client(token_json: str):
+    creds = Credentials.from_authorized_user_info(json.loads(token_json))
+    return build("tasks", "v1", credentials=creds)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _default_tasklist_id(token_json: str) -> str:
+    lists = _tasks_client(token_json).tasklists().list().execute().get("items", [])
+    return lists[0]["id"] if lists else "@default"
+
 def list_drive_transcripts(service) -> list[dict]:
-    """Find .txt or .vtt in Drive (non-trashed). Returns [{id, name}, ...]."""
-    q = "trashed=false and (mimeType='text/plain' or name contains '.vtt')"
-    results = service.files().list(q=q, pageSize=50, fields="files(id,name,mimeType,modifiedTime)").execute()
+    """Find .txt or .vtt in Drive (non-trashed). Returns [{id, name}, ...].
+
+    mimeType-only predicates: `name contains` forces a server-side substring
+    scan over every file in the Drive and dominates listing latency.
+    """
+    q = "trashed=false and (mimeType='text/vtt' or mimeType='text/plain')"
+    results = service.files().list(
+        q=q,
+        corpora="user",
+        spaces="drive",
+        orderBy="modifiedTime desc",
+        pageSize=50,
+        fields="files(id,name,mimeType,modifiedTime)",  # modifiedTime keys the download cache
+    ).execute()
     return results.get("files", [])
 
+_DRIVE_CHUNK_SIZE = 4 * 1024 * 1024  # fewer next_chunk round trips on big files
+
 def download_drive_file(service, file_id: str) -> str:
     request = service.files().get_media(fileId=file_id)
     buf = io.BytesIO()
-    downloader = MediaIoBaseDownload(fd=buf, request=request)
+    downloader = MediaIoBaseDownload(fd=buf, request=request, chunksize=_DRIVE_CHUNK_SIZE)
     done = False
     while not done:
         status, done = downloader.next_chunk()
-    buf.seek(0)
-    raw = buf.read().decode("utf-8", errors="ignore")
-    return parse_vtt(raw) if ("WEBVTT" in raw.upper()) else raw
-
-def push_to_google_tasks(creds: Credentials, title: str, notes: str, due_iso: str) -> str:
-    tasks_service = build("tasks", "v1", credentials=creds)
-    lists = tasks_service.tasklists().list().execute().get("items", [])
-    list_id = lists[0]["id"] if lists else "@default"
+    # Decode straight from the buffer's memoryview — skips the extra
+    # seek+read copy, so peak memory is one buffer plus the decoded str.
+    raw = str(buf.getbuffer(), "utf-8", "ignore")
+    # Sniff the magic word from the head only — uppercasing the whole file
+    # just to find a 6-char prefix copies the entire payload.
+    head = raw[:64].lstrip()
+    return parse_vtt(raw) if head[:6].upper() == "WEBVTT" else raw
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _drive_text_cached(_service, file_id: str, modified_time: str) -> str:
+    # modified_time is part of the key so an edited file re-downloads;
+    # _service is skipped by the hasher.
+    return download_drive_file(_service, file_id)
+
+def build_task_body(title: str, notes: str, due_iso: str) -> dict:
     body = {"title": title}
     if notes:
         body["notes"] = notes
     if due_iso != "None":
         body["due"] = f"{due_iso}T09:00:00.000Z"  # RFC3339
-    created = tasks_service.tasks().insert(tasklist=list_id, body=body).execute()
-    return created.get("id", "")
+    return body
+
+_TASKS_BATCH_LIMIT = 100  # Google batch endpoints accept at most 100 calls
+
+def push_tasks_batch(tasks_service, list_id: str, bodies: list[dict]) -> tuple[int, list[str]]:
+    """Insert task bodies via batched HTTP requests (one round trip per 100
+    inserts instead of one per task). Returns (created_count, errors)."""
+    created = 0
+    errors: list[str] = []
+
+    def _on_done(request_id, response, exception):
+        nonlocal created
+        if exception is not None:
+            errors.append(str(exception))
+        else:
+            created += 1
+
+    for i in range(0, len(bodies), _TASKS_BATCH_LIMIT):
+        batch = tasks_service.new_batch_http_request(callback=_on_done)
+        for body in bodies[i:i + _TASKS_BATCH_LIMIT]:
+            batch.add(tasks_service.tasks().insert(tasklist=list_id, body=body))
+        batch.execute()
+    return created, errors
 
 # ===================================================
 # Session state
 # ===================================================
-if "rows" not in st.session_state:
-    st.session_state.rows = []  # list[dict] with RESULT_COLS
+if "cols" not in st.session_state:
+    # Column-major store: one list per RESULT_COLS column. Building the
+    # DataFrame from columns skips per-row dict traversal + dtype inference
+    # on every rerun as results accumulate.
+    st.session_state.cols = {c: [] for c in RESULT_COLS}
+
+def _append_rows(rows: list[dict]) -> None:
+    cols = st.session_state.cols
+    for row in rows:
+        for c in RESULT_COLS:
+            cols[c].append(row[c])
 
 # ===================================================
 # Import from Google Drive (optional)
@@ -272,35 +372,28 @@ with st.expander("Import from Google Drive (optional)"):
     drive_files: list[dict] = []
     if "drive_creds" in st.session_state:
         try:
-            drive_service = build("drive", "v3", credentials=st.session_state.drive_creds)
+            drive_service = _drive_client(st.session_state.drive_creds.to_json())
             drive_files = list_drive_transcripts(drive_service)
             names = [f["name"] for f in drive_files]
             select = st.multiselect("Choose transcripts from Drive", names)
             if st.button("Summarize Selected from Drive"):
                 with st.spinner("Summarizing from Drive..."):
-                    for name in select:
-                        meta = next((f for f in drive_files if f["name"] == name), None)
-                        if not meta:
-                            continue
-                        text = download_drive_file(drive_service, meta["id"])
-                        data = analyze_transcript(text)
-                        if data.get("items"):
-                            for it in data["items"]:
-                                st.session_state.rows.append({
-                                    "File": name,
-                                    "Summary": data.get("summary", ""),
-                                    "Action": it.get("action", ""),
-                                    "Owner": it.get("owner", "None"),
-                                    "Due": it.get("due", "None"),
-                                })
-                        else:
-                            st.session_state.rows.append({
-                                "File": name,
-                                "Summary": data.get("summary", ""),
-                                "Action": "",
-                                "Owner": "None",
-                                "Due": "None",
-                            })
+                    chosen = [f for f in drive_files if f["name"] in set(select)]
+                    # Download + analyze per file as one task so Drive I/O and
+                    # LLM calls overlap across files.
+                    with ThreadPoolExecutor(max_workers=MAX_ANALYSIS_WORKERS) as pool:
+                        futures = [
+                            pool.submit(
+                                lambda f: _process_one(
+                                    f["name"],
+                                    _drive_text_cached(drive_service, f["id"], f.get("modifiedTime", "")),
+                                ),
+                                f,
+                            )
+                            for f in chosen
+                        ]
+                        for fut in as_completed(futures):
+                            _append_rows(fut.result())
                 st.success("Done.")
         except Exception as e:
             st.error(f"Drive error: {e}")
@@ -316,26 +409,21 @@ uploaded = st.file_uploader("Drop .txt or .vtt transcript(s)", type=["txt", "vtt
 
 if uploaded and st.button("Analyze Uploaded"):
     with st.spinner("Analyzing..."):
-        for up in uploaded:
-            text = read_uploaded_text(up)
-            data = analyze_transcript(text)
-            if data.get("items"):
-                for it in data["items"]:
-                    st.session_state.rows.append({
-                        "File": up.name,
-                        "Summary": data.get("summary", ""),
-                        "Action": it.get("action", ""),
-                        "Owner": it.get("owner", "None"),
-                        "Due": it.get("due", "None"),
-                    })
-            else:
-                st.session_state.rows.append({
-                    "File": up.name,
-                    "Summary": data.get("summary", ""),
-                    "Action": "",
-                    "Owner": "None",
-                    "Due": "None",
-                })
+        if len(uploaded) == 1:
+            # Single file: stream so tokens show as they arrive.
+            up = uploaded[0]
+            data = analyze_transcript(read_uploaded_text(up), stream=True)
+            _append_rows(_rows_for(up.name, data))
+        else:
+            # Multiple files: fan out so LLM calls overlap (streaming to
+            # widgets is main-thread-only, so batch mode stays silent).
+            with ThreadPoolExecutor(max_workers=MAX_ANALYSIS_WORKERS) as pool:
+                futures = [
+                    pool.submit(_process_one, up.name, read_uploaded_text(up))
+                    for up in uploaded
+                ]
+                for fut in as_completed(futures):
+                    _append_rows(fut.result())
     st.success("Parsed.")
 
 st.divider()
@@ -343,45 +431,67 @@ st.divider()
 # ===================================================
 # Results table + CSV
 # ===================================================
-st.subheader("Results")
-df = pd.DataFrame(st.session_state.rows, columns=RESULT_COLS) if st.session_state.rows else pd.DataFrame(columns=RESULT_COLS)
-st.dataframe(df, use_container_width=True, height=420)
-
-csv = df.to_csv(index=False).encode("utf-8")
-st.download_button("Download CSV", data=csv, file_name=f"{meeting_title.replace(' ','_')}_actions.csv", mime="text/csv")
-
-st.divider()
+@st.cache_data(show_spinner=False)
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    # re-encode only when the results actually change, not on every rerun
+    return df.to_csv(index=False).encode("utf-8")
+
+# Fragments: interactions inside these panels rerun only the panel, not the
+# whole script (no upload re-read, no Drive section, etc.).
+@st.fragment
+def results_panel():
+    st.subheader("Results")
+    df = pd.DataFrame(st.session_state.cols, copy=False)
+    st.dataframe(df, use_container_width=True, height=420)
+    csv = _to_csv_bytes(df)
+    st.download_button("Download CSV", data=csv, file_name=f"{meeting_title.replace(' ','_')}_actions.csv", mime="text/csv")
 
 # ===================================================
 # Push to Google Tasks
 # ===================================================
-st.subheader("Push Action Items to Google Tasks")
-
-to_push = st.multiselect(
-    "Choose which rows to push",
-    options=[f"{i}: {r['Action']}" for i, r in df.iterrows()],
-    default=[f"{i}: {r['Action']}" for i, r in df.iterrows() if r["Action"]],
-)
+@st.fragment
+def push_panel():
+    st.subheader("Push Action Items to Google Tasks")
+    # Work on the column lists directly — no DataFrame, no iterrows
+    # (which boxes every row into a Series).
+    cols = st.session_state.cols
+    actions = cols["Action"]
+    options = [f"{i}: {a}" for i, a in enumerate(actions)]
+
+    to_push = st.multiselect(
+        "Choose which rows to push",
+        options=options,
+        default=[opt for opt, a in zip(options, actions) if a],
+    )
 
-if st.button("➕ Create Google Tasks for Selected"):
-    if not to_push:
-        st.warning("Select at least one row with an Action.")
-    else:
-        creds = ensure_creds("token.tasks.json", TASKS_SCOPES)
-        if creds is None:
-            st.stop()
-        created = 0
-        for opt in to_push:
-            idx = int(opt.split(":")[0])
-            row = df.iloc[idx]
-            if not row["Action"]:
-                continue
-            title = row["Action"][:255]
-            notes = f"{meeting_title}\nOwner: {row['Owner']}\nFile: {row['File']}\n\nSummary:\n{row['Summary']}"
-            due = row["Due"] if row["Due"] else "None"
+    if st.button("➕ Create Google Tasks for Selected"):
+        if not to_push:
+            st.warning("Select at least one row with an Action.")
+        else:
+            creds = ensure_creds("token.tasks.json", TASKS_SCOPES)
+            if creds is None:
+                st.stop()
+            token_json = creds.to_json()
+            tasks_service = _tasks_client(token_json)
+            list_id = _default_tasklist_id(token_json)
+            bodies = []
+            for opt in to_push:
+                idx = int(opt.split(":")[0])
+                if not actions[idx]:
+                    continue
+                title = actions[idx][:255]
+                notes = f"{meeting_title}\nOwner: {cols['Owner'][idx]}\nFile: {cols['File'][idx]}\n\nSummary:\n{cols['Summary'][idx]}"
+                due = cols["Due"][idx] or "None"
+                bodies.append(build_task_body(title, notes, due))
             try:
-                push_to_google_tasks(creds, title, notes, due)
-                created += 1
+                created, errors = push_tasks_batch(tasks_service, list_id, bodies)
             except Exception as e:
-                st.error(f"Task create error for row {idx}: {e}")
-        st.success(f"Created {created} task(s).")
+                st.error(f"Task batch error: {e}")
+            else:
+                for err in errors:
+                    st.error(f"Task create error: {err}")
+                st.success(f"Created {created} task(s).")
+
+results_panel()
+st.divider()
+push_panel()
@@ -0,0 +1,121 @@
+# parsing.py
+"""Hot-path text parsing for brieflyAI: VTT cleanup, due-date
+normalization, and JSON salvage from LLM output.
+
+Kept free of Streamlit/Google imports and fully type-annotated so it can
+be AOT-compiled (e.g. `mypyc parsing.py`) for a further speedup on the
+per-character scanners; the pure-Python module works as-is when no
+compiled extension is present.
+"""
+from __future__ import annotations
+
+import json
+import re
+from datetime import date
+from typing import Optional
+
+try:  # orjson is 2-5x faster for the extract_json retry loop
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+ISO_DATE_RE = re.compile(r"\b(20\d{2})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])\b")
+# One alternation covering everything parse_vtt strips: header lines, cue
+# indices, cue timing lines, and inline time tokens (0:12, 01:02:03.500).
+_VTT_STRIP = re.compile(
+    r"(?m)"
+    r"^(?i:WEBVTT|Kind:|Language:).*$"
+    r"|^\d+\s*$"
+    r"|^\d{2}:\d{2}:\d{2}\.\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}\.\d{3}.*$"
+    r"|\b\d{1,2}:\d{2}(?::\d{2})?(?:\.\d{1,3})?\b"
+)
+_WS_RE = re.compile(r"\s+")
+# Compiled once; the bounded lazy quantifier caps backtracking when an LLM
+# emits an unclosed fence or nested braces, instead of stalling for 100ms+.
+_FENCE_RE = re.compile(r"```json\s*([\s\S]{1,200000}?)\s*```")
+
+def only_future_iso_or_none(s: Optional[str], today: Optional[date] = None) -> str:
+    """Return YYYY-MM-DD if present AND >= today; else 'None'.
+
+    Callers looping over many items should pass today once instead of
+    paying a clock read per call.
+    """
+    if not s:
+        return "None"
+    m = ISO_DATE_RE.search(s)
+    if not m:
+        return "None"
+    y, mo, da = map(int, m.groups())
+    try:
+        d = date(y, mo, da)  # regex pre-validates ranges; this catches e.g. Feb 30
+    except ValueError:
+        return "None"
+    if today is None:
+        today = date.today()
+    return d.isoformat() if d >= today else "None"
+
+def parse_vtt(vtt_text: str) -> str:
+    """Remove cue lines and inline timestamps; keep spoken content.
+
+    Two regex passes over the whole buffer (strip cue noise, collapse
+    whitespace) — no per-line Python loop, so cost is linear in bytes.
+    """
+    return _WS_RE.sub(" ", _VTT_STRIP.sub(" ", vtt_text)).strip()
+
+def _find_json_spans(s: str) -> list[tuple[int, int]]:
+    """Return (start, end) spans of top-level balanced {...} / [...] blocks.
+
+    One pass tracking bracket depth (skipping string literals and escapes),
+    so candidates come out in linear time instead of the O(n^2) blowup a
+    greedy DOTALL regex hits on verbose LLM output.
+    """
+    spans: list[tuple[int, int]] = []
+    stack: list[str] = []
+    start = -1
+    in_str = False
+    esc = False
+    close_for = {"{": "}", "[": "]"}
+    for i, c in enumerate(s):
+        if in_str:
+            if esc:
+                esc = False
+            elif c == "\\":
+                esc = True
+            elif c == '"':
+                in_str = False
+        elif c in close_for:
+            if not stack:
+                start = i
+            stack.append(close_for[c])
+        elif c in "}]":
+            if stack and c == stack[-1]:
+                stack.pop()
+                if not stack:
+                    spans.append((start, i + 1))
+            else:  # mismatched close: abandon the current candidate
+                stack.clear()
+        elif c == '"' and stack:
+            in_str = True
+    return spans
+
+def extract_json(text: str) -> Optional[dict]:
+    """Robustly extract the last valid JSON object/array from an LLM response."""
+    # ```json ... ``` (cheap membership test before the regex)
+    if "```json" in text:
+        m = _FENCE_RE.search(text)
+        if m:
+            try:
+                return _json_loads(m.group(1))
+            except Exception:
+                pass
+    # balanced {...} or [...] spans, last one first
+    for a, b in reversed(_find_json_spans(text)):
+        try:
+            return _json_loads(text[a:b])
+        except Exception:
+            continue
+    # full string
+    try:
+        return _json_loads(text)
+    except Exception:
+        return None